@@ -1,9 +1,11 @@
 import time             # Importa o módulo time para funções relacionadas a tempo (sincronização).
 import sys              # Importa o módulo sys para interagir com o sistema, especialmente a saída (stdout).
 import os               # Importa o módulo os para interagir com o sistema operacional (tamanho do terminal).
-import threading        # Importa o módulo threading para gerenciar a concorrência (screen_lock).
-import random           # Importa o módulo random (mantido do original, mas não usado neste modelo).
+import threading        # Importa o módulo threading para gerenciar a concorrência (screen_lock e thread de desenho).
 import argparse         # Importa o módulo argparse para processar argumentos da linha de comando.
+import bisect           # Importa o módulo bisect para localizar a linha atual por busca binária.
+import signal           # Importa o módulo signal para reagir ao redimensionamento do terminal (SIGWINCH).
+import functools        # Importa o módulo functools para memorizar o cabeçalho já renderizado (lru_cache).
 from src.loaders import SpotifyLyricsLoader  # Importa o carregador de letras do Spotify.
 
 # --- ANÁLISE DE ARGUMENTOS DA LINHA DE COMANDO ---
@@ -47,18 +49,50 @@ INFO_COLOR = ""         # String vazia: usa a cor padrão do terminal para Títu
 # Função lambda para gerar o código ANSI que posiciona o cursor em uma linha (row) e coluna (col).
 CURSOR_POS = lambda row, col: f"\033[{row};{col}H"
 CLEAR_SCREEN = "\033[H\033[J" # Código ANSI para limpar a tela e mover o cursor para o canto (1;1).
+CLEAR_LINE = "\033[K"         # Código ANSI para apagar do cursor até o fim da linha.
 HIDE_CURSOR = "\033[?25l"     # Código ANSI para esconder o cursor.
 SHOW_CURSOR = "\033[?25h"     # Código ANSI para mostrar o cursor (restauração).
 
+# Prefixos de estilo combinados uma única vez (evita concatenar os códigos a cada quadro).
+INFO_STYLE = BOLD + INFO_COLOR            # Título/Artista.
+ACTIVE_STYLE = BOLD + MAIN_COLOR          # Linha ativa.
+HIGHLIGHT_STYLE = BOLD + HIGHLIGHT_COLOR  # Linha ativa com 'highlight' (ou a primeira, em time 0.0).
+
 # --- VARIÁVEIS GLOBAIS DE LAYOUT ---
 TEXT_WIDTH = 60         # Define a largura máxima que o texto das letras pode ocupar.
 TEXT_HEIGHT = 15        # Define a altura máxima da área de exibição das letras.
+START_COL = 2           # Coluna inicial de renderização (margem esquerda).
+START_ROW = 1           # Linha inicial de renderização (topo).
 terminal_width = 80     # Variável global para armazenar a largura detectada do terminal (padrão 80).
 terminal_height = 24    # Variável global para armazenar a altura detectada do terminal (padrão 24).
 
+# Posição do cursor pré-calculada para cada linha da área de exibição (índice 0 = START_ROW).
+ROW_POS = [CURSOR_POS(START_ROW + row, START_COL) for row in range(TEXT_HEIGHT)]
+
+# --- VERSÕES EM BYTES (display_content escreve o quadro direto na camada binária do stdout) ---
+OUTPUT_ENCODING = sys.stdout.encoding or "utf-8" # Codificação usada para o texto das letras.
+RESET_B = RESET.encode("ascii")
+CLEAR_SCREEN_B = CLEAR_SCREEN.encode("ascii")
+CLEAR_LINE_B = CLEAR_LINE.encode("ascii")
+INFO_STYLE_B = INFO_STYLE.encode("ascii")
+ACTIVE_STYLE_B = ACTIVE_STYLE.encode("ascii")
+HIGHLIGHT_STYLE_B = HIGHLIGHT_STYLE.encode("ascii")
+INACTIVE_LYRIC_COLOR_B = INACTIVE_LYRIC_COLOR.encode("ascii")
+ROW_POS_B = [pos.encode("ascii") for pos in ROW_POS]
+
 # Objeto Lock para controlar o acesso à saída do terminal em ambientes multithread.
 screen_lock = threading.Lock()
 
+# Último quadro desenhado (par (estilo, texto) em bytes de cada linha da tela), usado para redesenhar só o que mudou.
+_prev_frame = []
+BLANK_ROW = (b"", b"")                  # Linha em branco: sem estilo e sem texto.
+
+# Indica que o terminal mudou de tamanho e o próximo quadro deve limpar a tela e redesenhar tudo.
+_resize_pending = False
+
+# No Unix o terminal avisa o redimensionamento com SIGWINCH; no Windows o tamanho é consultado a cada quadro.
+HAS_SIGWINCH = hasattr(signal, "SIGWINCH")
+
 # --- FUNÇÃO PARA PEGAR O TAMANHO DO TERMINAL ---
 def update_terminal_size():
     """Função para tentar obter o tamanho atual do terminal."""
@@ -73,6 +107,15 @@ def update_terminal_size():
     except OSError:
         pass # Ignora o erro e mantém os valores padrão se falhar.
 
+# --- FUNÇÃO CHAMADA QUANDO O TERMINAL É REDIMENSIONADO ---
+def handle_resize(signum=None, frame=None):
+    """Atualiza o tamanho do terminal e, se ele mudou, agenda um redesenho completo (handler de SIGWINCH)."""
+    global _resize_pending
+    previous_size = (terminal_width, terminal_height)
+    update_terminal_size()
+    if (terminal_width, terminal_height) != previous_size:
+        _resize_pending = True
+
 # --- FUNÇÃO PARA AJUSTAR O TEXTO À LARGURA ---
 def split_and_wrap_text(text, max_width):
     """Função que processa o texto para aplicar a quebra de linha ('wrap')."""
@@ -81,104 +124,188 @@ def split_and_wrap_text(text, max_width):
     wrapped_lines = []                  # Lista para armazenar as linhas finais formatadas.
 
     for part in parts_by_newline:       # Itera sobre cada parte separada por '\n'.
-        words = part.split()            # Divide a parte em palavras.
-        current_line = []               # Lista para construir a linha atual.
-        current_line_length = 0         # Contador do comprimento da linha atual.
-        
-        for word in words:              # Itera sobre cada palavra.
-            # Verifica se a palavra cabe na largura máxima.
-            if current_line_length + len(word) + (1 if current_line else 0) <= max_width:
-                current_line.append(word) # Adiciona a palavra à linha.
-                # Atualiza o comprimento da linha, incluindo o espaço.
-                current_line_length += len(word) + (1 if current_line else 0)
-            else:
-                # Se não couber, adiciona a linha completa à lista de linhas finais.
-                wrapped_lines.append(" ".join(current_line))
-                current_line = [word]     # Começa uma nova linha com a palavra.
-                current_line_length = len(word) # Define o comprimento da nova linha.
-        
-        if current_line:                # Após o loop, se a linha atual não estiver vazia, a adiciona.
-            wrapped_lines.append(" ".join(current_line))
+        normalized = " ".join(part.split()) # Normaliza os espaços: palavras separadas por um único espaço.
+        length = len(normalized)        # Comprimento calculado uma única vez por parte.
+        start = 0                       # Início da linha atual dentro do texto (sem recortar o restante).
+
+        # No terminal cada caractere ocupa uma coluna, então o ponto de quebra é encontrado
+        # direto no texto (um único rfind), sem medir palavra por palavra.
+        while length - start > max_width:
+            cut = normalized.rfind(" ", start, start + max_width + 1) # Último espaço que ainda cabe na linha.
+            if cut == -1:
+                # A primeira palavra é maior que a largura: ela fica sozinha na linha.
+                cut = normalized.find(" ", start + max_width)
+                if cut == -1:
+                    break               # Só sobrou essa palavra.
+            wrapped_lines.append(normalized[start:cut]) # Adiciona a linha completa à lista de linhas finais.
+            start = cut + 1             # Continua a partir da palavra seguinte.
+
+        if start < length:              # Adiciona o que sobrou (se a parte não estiver vazia).
+            wrapped_lines.append(normalized[start:])
     
     return wrapped_lines                # Retorna a lista de linhas ajustadas.
 
+# --- FUNÇÃO PARA PRÉ-CALCULAR AS QUEBRAS DE LINHA ---
+def encode_text(text):
+    """Codifica um texto para bytes na codificação do terminal (caracteres inválidos viram '?')."""
+    return text.encode(OUTPUT_ENCODING, errors="replace")
+
+def precompute_wrap(lyrics_data, width):
+    """
+    Prepara as letras para o desenho uma única vez, antes da animação.
+
+    Returns:
+        list: Uma tupla (estilo_ativo, partes) por letra, onde estilo_ativo são os bytes do
+              estilo usado quando ela é a linha ativa e partes são seus trechos já quebrados e codificados
+    """
+    render_lines = []
+    for line_data in lyrics_data:
+        # Usa a cor de destaque se houver 'highlight' ou se for a primeira linha (time 0.0).
+        if line_data.get("highlight", False) or line_data.get("time", -1) == 0.0:
+            active_style = HIGHLIGHT_STYLE_B
+        else:
+            active_style = ACTIVE_STYLE_B
+        parts = tuple(encode_text(part) for part in split_and_wrap_text(line_data["original"], width))
+        render_lines.append((active_style, parts))
+    return render_lines
+
+# --- CABEÇALHO (TÍTULO E ARTISTA) ---
+@functools.lru_cache(maxsize=4)
+def _render_header(title_lines, artist_lines, width, height):
+    """
+    Monta as linhas do cabeçalho (título, artista e a linha em branco que os separa das letras).
+
+    O cabeçalho é o mesmo em todos os quadros de uma música, então o resultado fica em cache;
+    como a chave inclui tudo de que ele depende, não é preciso invalidá-lo.
+
+    Returns:
+        tuple: Pares (estilo, texto) em bytes, no máximo `height` linhas
+    """
+    rows = [
+        (INFO_STYLE_B, encode_text(part))
+        for line in title_lines + artist_lines  # Título e artista em Negrito e cor INFO_COLOR.
+        for part in split_and_wrap_text(line, width)
+    ][:height]
+    if len(rows) < height:
+        rows.append(BLANK_ROW)          # Linha em branco após o Título/Artista.
+    return tuple(rows)
+
 # --- FUNÇÃO PRINCIPAL: Display de TODO o Conteúdo ---
-def display_content(current_line_index, lyrics_data, content_info):
-    """Função que desenha todo o conteúdo na tela, focando na linha ativa."""
+def display_content(current_line_index, render_lines, content_info):
+    """
+    Função que desenha todo o conteúdo na tela, focando na linha ativa.
+
+    Só as linhas que mudaram desde o quadro anterior são reescritas; a tela inteira
+    só é limpa quando o tamanho do terminal muda. `render_lines` é a lista de tuplas
+    retornada por precompute_wrap().
+    """
+    global _resize_pending
     
-    start_col = 2                       # Coluna inicial de renderização (margem esquerda).
-    start_row = 1                       # Linha inicial de renderização (topo).
-    LYRIC_WRAP_WIDTH = TEXT_WIDTH       # Usa a largura definida para quebrar as letras.
-    current_display_row = 0             # Contador de linhas já exibidas na tela.
+    # 1. RENDERIZA TÍTULO E ARTISTA (já prontos, vindos do cache e limitados a TEXT_HEIGHT)
+    header_rows = _render_header(
+        tuple(content_info["title_lines"]), tuple(content_info["artist_lines"]), TEXT_WIDTH, TEXT_HEIGHT
+    )
+    lyric_rows_available = TEXT_HEIGHT - len(header_rows) # Quantas linhas de letra ainda cabem na tela.
+
+    # 2. LÓGICA DE EXIBIÇÃO DAS LETRAS
+    # A linha ativa é a primeira exibida (estilo Spotify). Cada letra ocupa ao menos uma linha da tela,
+    # então basta pegar no máximo `lyric_rows_available` letras e cortar as partes que sobrarem.
+    visible_lyrics = render_lines[current_line_index:current_line_index + lyric_rows_available]
+    lyric_rows = [
+        # A linha ATIVA usa o estilo pré-calculado; as INATIVAS, o Cinza Escuro Suave.
+        (active_style if offset == 0 else INACTIVE_LYRIC_COLOR_B, line_part)
+        for offset, (active_style, wrapped_lines) in enumerate(visible_lyrics)
+        for line_part in wrapped_lines
+    ]
+
+    # Par (estilo, texto) de cada linha do quadro; o que sobrar (após o fim das letras) fica em branco.
+    new_frame = list(header_rows)
+    new_frame += lyric_rows[:lyric_rows_available]
+    new_frame += [BLANK_ROW] * (TEXT_HEIGHT - len(new_frame))
+
+    # 3. ESCREVE APENAS AS LINHAS ALTERADAS
+    if not HAS_SIGWINCH:
+        handle_resize()                 # Sem SIGWINCH: detecta o redimensionamento consultando o tamanho.
 
     with screen_lock:                   # Entra na seção crítica, garantindo acesso exclusivo ao stdout.
-        sys.stdout.write(CLEAR_SCREEN)  # Limpa a tela antes de redesenhar.
-
-        # 1. RENDERIZA TÍTULO E ARTISTA
-        for title_part_line in content_info["title_lines"]: # Itera sobre as linhas do título.
-            title_wrapped = split_and_wrap_text(title_part_line, LYRIC_WRAP_WIDTH) # Quebra de linha no título.
-            for line in title_wrapped:                      # Itera sobre as partes do título.
-                if current_display_row < TEXT_HEIGHT:       # Verifica se há espaço vertical.
-                    # Posiciona o cursor para escrever o título.
-                    sys.stdout.write(CURSOR_POS(start_row + current_display_row, start_col))
-                    # Escreve o título em Negrito e cor INFO_COLOR.
-                    sys.stdout.write(f"{BOLD}{INFO_COLOR}{line}{RESET}") 
-                    current_display_row += 1                # Incrementa o contador de linhas exibidas.
-
-        for info_part_line in content_info["artist_lines"]: # Repete o processo para o nome do artista.
-            info_wrapped = split_and_wrap_text(info_part_line, LYRIC_WRAP_WIDTH)
-            for line in info_wrapped:
-                if current_display_row < TEXT_HEIGHT:
-                    sys.stdout.write(CURSOR_POS(start_row + current_display_row, start_col))
-                    sys.stdout.write(f"{BOLD}{INFO_COLOR}{line}{RESET}") 
-                    current_display_row += 1
-
-        if current_display_row < TEXT_HEIGHT:
-            current_display_row += 1                        # Adiciona uma linha em branco após o Título/Artista.
-    
-        # 2. LÓGICA DE EXIBIÇÃO DAS LETRAS
-        start_lyric_index = current_line_index              # O índice inicial é a linha ativa (estilo Spotify).
-        lines_to_show = TEXT_HEIGHT - current_display_row   # Calcula quantas linhas de letra ainda cabem na tela.
-        end_lyric_index = start_lyric_index + lines_to_show # Índice da última linha de letra a ser exibida.
-
-        for i in range(start_lyric_index, end_lyric_index): # Itera apenas sobre as letras visíveis.
-            if i >= 0 and i < len(lyrics_data):             # Verifica se o índice é válido.
-                line_data = lyrics_data[i]                  # Pega os dados da linha (tempo, texto, highlight).
-                line_text_to_wrap = line_data["original"]   # Pega o texto original.
-                
-                active_highlight_color = HIGHLIGHT_COLOR    # Define a cor de destaque (vazia).
-                wrapped_lines = split_and_wrap_text(line_text_to_wrap, LYRIC_WRAP_WIDTH) # Quebra de linha na letra.
-                
-                is_highlighted = line_data.get("highlight", False) # Verifica se a linha tem o marcador "highlight".
-                
-                for line_part in wrapped_lines:             # Itera sobre as partes da linha (se houver quebra de linha).
-                    # Define a cor/estilo:
-                    if i == current_line_index:             # Se for a linha ATIVA:
-                        # Usa BOLD e a cor de destaque se houver 'highlight' ou se for a primeira linha (time 0.0).
-                        color = BOLD + (active_highlight_color if is_highlighted or line_data.get("time", -1) == 0.0 else MAIN_COLOR)
-                    else:
-                        # Se for linha INATIVA: usa a cor Cinza Escuro Suave.
-                        color = INACTIVE_LYRIC_COLOR
-                    
-                    display_line = f"{color}{line_part}{RESET}" # Formata a linha com cores e reset.
-                    
-                    if current_display_row < TEXT_HEIGHT:   # Verifica o limite da tela.
-                        row_to_render = start_row + current_display_row
-                        
-                        sys.stdout.write(CURSOR_POS(row_to_render, start_col)) # Posiciona o cursor.
-                        sys.stdout.write(display_line)      # Escreve a linha no terminal.
-                    current_display_row += 1                # Incrementa o contador de linhas.
-            else:
-                current_display_row += 1                    # Se o índice for inválido (após o fim das letras), incrementa a linha de exibição.
-                
-        sys.stdout.flush()                                  # Força a escrita de todo o buffer de saída.
+        buf = []                        # Buffer com todos os fragmentos do quadro.
+        if _resize_pending:
+            _resize_pending = False
+            buf.append(CLEAR_SCREEN_B)  # Terminal redimensionado: limpa a tela e força o redesenho completo.
+            _prev_frame.clear()
+
+        # O estilo SGR continua valendo depois de mover o cursor: ele só é reenviado quando muda,
+        # então uma sequência de linhas inativas compartilha um único código de cor.
+        current_style = b""             # Estilo ativo no terminal durante a escrita deste quadro.
+        for row, row_content in enumerate(new_frame):
+            previous = _prev_frame[row] if row < len(_prev_frame) else BLANK_ROW
+            if row_content != previous: # Pula as linhas idênticas às do quadro anterior.
+                style, text = row_content
+                buf.append(ROW_POS_B[row])
+                if text and style != current_style:
+                    if current_style:
+                        buf.append(RESET_B) # Desfaz o estilo anterior (ex.: negrito) antes de trocar.
+                    buf.append(style)
+                    current_style = style
+                buf.append(text)
+                buf.append(CLEAR_LINE_B) # Apaga o que sobrou de um texto anterior mais longo.
+        if current_style:
+            buf.append(RESET_B)         # Um único reset no fim do quadro.
+        _prev_frame[:] = new_frame
+
+        # Uma única escrita por quadro, já em bytes: nada é recodificado a cada quadro.
+        # sys.stdout.buffer (e não o descritor cru) trata escritas parciais e, no Windows,
+        # entrega o UTF-8 ao console corretamente.
+        sys.stdout.buffer.write(b"".join(buf))
+        sys.stdout.flush()              # Força a escrita de todo o buffer de saída.
+
+# --- THREAD DE DESENHO (separa o desenho do controle de tempo) ---
+# O loop de tempo (produtor) só publica o índice da linha ativa mais recente; a thread de desenho
+# (consumidor) acorda e desenha sempre o último índice publicado, descartando os intermediários.
+# Assim um terminal lento (SSH, WSL) atrasa apenas o desenho, nunca o avanço das letras.
+_latest_display_index = 0               # Último índice publicado pelo loop de tempo.
+_render_event = threading.Event()       # Sinaliza à thread de desenho que há algo novo.
+_render_stop = False                    # Pede o encerramento da thread de desenho.
+
+def render_loop(render_lines, content_info):
+    """Corpo da thread de desenho: espera um novo índice e desenha o mais recente."""
+    while True:
+        _render_event.wait()            # Dorme até o loop de tempo publicar algo.
+        _render_event.clear()           # Limpa antes de ler: uma publicação posterior acorda de novo.
+        if _render_stop:
+            break
+        try:
+            display_content(_latest_display_index, render_lines, content_info)
+        except OSError:
+            break                       # Erro de saída: encerra a thread (o loop de tempo percebe e para).
+
+def start_render_thread(render_lines, content_info):
+    """Inicia a thread de desenho e a retorna."""
+    global _render_stop
+    _render_stop = False
+    _render_event.clear()
+    render_thread = threading.Thread(target=render_loop, args=(render_lines, content_info), daemon=True)
+    render_thread.start()
+    return render_thread
+
+def publish_display_index(index):
+    """Publica o índice da linha ativa para a thread de desenho (nunca bloqueia)."""
+    global _latest_display_index
+    _latest_display_index = index       # Atribuição de int é atômica no CPython.
+    _render_event.set()
+
+def stop_render_thread(render_thread):
+    """Pede o encerramento da thread de desenho e espera ela terminar."""
+    global _render_stop
+    _render_stop = True
+    _render_event.set()
+    render_thread.join()
 
 # --- FUNÇÃO PARA LIMPAR TELA E CURSOR ---
 def cleanup_screen():
     """Função essencial para restaurar o estado padrão do terminal ao sair."""
     with screen_lock:                       # Protege a saída do terminal.
-        sys.stdout.write(CLEAR_SCREEN)      # Limpa a tela.
-        sys.stdout.write(SHOW_CURSOR)       # Torna o cursor visível.
+        sys.stdout.write(CLEAR_SCREEN + SHOW_CURSOR) # Limpa a tela e torna o cursor visível (uma única escrita).
         sys.stdout.flush()                  # Garante a execução dos comandos.
 
 # ----------------------------------------------------------------------------------
@@ -223,76 +350,84 @@ def initialize_lyrics_data(arquivo_letras):
 # --- FUNÇÃO PRINCIPAL PARA A ANIMAÇÃO ---
 def start_lyrics_animation():
     """Gerencia o ciclo de tempo e a lógica de avanço das letras."""
-    sys.stdout.write(HIDE_CURSOR)           # Esconde o cursor no início.
-    sys.stdout.write(CLEAR_SCREEN)          # Limpa a tela no início.
+    sys.stdout.write(HIDE_CURSOR + CLEAR_SCREEN) # Esconde o cursor e limpa a tela no início (uma única escrita).
     sys.stdout.flush()
+    _prev_frame.clear()                     # A tela está vazia: o primeiro quadro é desenhado por completo.
 
     update_terminal_size()                  # Obtém o tamanho atual do terminal.
+    if HAS_SIGWINCH:
+        signal.signal(signal.SIGWINCH, handle_resize) # A partir daqui o tamanho só é atualizado ao redimensionar.
+    render_lines = precompute_wrap(LYRICS_DATA, TEXT_WIDTH) # Prepara as linhas uma única vez, fora do loop.
     
-    start_time = time.monotonic()           # Registra o tempo inicial (referência zero).
+    lyric_times = [line_data["time"] for line_data in LYRICS_DATA] # Tempos das linhas (em ordem crescente).
+
+    render_thread = start_render_thread(render_lines, CONTENT_INFO) # Desenho fora do loop de tempo.
+
+    start_time = time.perf_counter()        # Registra o tempo inicial (referência zero).
     current_line_index = 0                  # Inicializa o índice da próxima linha a ser carregada.
     
-    # Loop principal: continua enquanto não atingir a duração total.
-    while time.monotonic() - start_time < TOTAL_MUSIC_DURATION:
-        elapsed_time = time.monotonic() - start_time # Calcula o tempo decorrido desde o início.
-        
-        # Avança o índice da linha sempre que o tempo decorrido ultrapassa o tempo da próxima linha.
-        while current_line_index < len(LYRICS_DATA) and elapsed_time >= LYRICS_DATA[current_line_index]["time"]:
-            current_line_index += 1
-            
-        try:
+    try:
+        # Loop principal: continua enquanto não atingir a duração total.
+        while True:
+            elapsed_time = time.perf_counter() - start_time # Calcula (uma única vez) o tempo decorrido desde o início.
+            if elapsed_time >= TOTAL_MUSIC_DURATION:
+                break
+
+            # Para se a thread de desenho encerrou por erro de saída.
+            if not render_thread.is_alive():
+                break
+
+            # Índice da próxima linha: quantidade de linhas cujo tempo já foi alcançado (busca binária).
+            current_line_index = bisect.bisect_right(lyric_times, elapsed_time)
+
             # O índice da linha ATIVA (a que está sendo exibida) é o anterior.
             display_index_for_display = current_line_index - 1
-            
+
             # Condição para garantir que a primeira linha seja exibida imediatamente se time=0.0.
             if display_index_for_display < 0 and LYRICS_DATA and LYRICS_DATA[0]["time"] == 0.0:
                 display_index_for_display = 0
-            
-            # Pula o loop de exibição se ainda não chegou ao tempo da primeira linha.
-            if display_index_for_display < 0:
-                continue
-
-            # Proteção contra ultrapassar o limite final da lista.
-            if display_index_for_display >= len(LYRICS_DATA):
-                display_index_for_display = len(LYRICS_DATA) - 1
-                
-            # Chama a função de exibição para desenhar na tela.
-            display_content(display_index_for_display, LYRICS_DATA, CONTENT_INFO)
-            
-        except OSError:
-            break # Sai do loop em caso de erro de saída.
-            
-        # --- Cálculo do Tempo de Espera (Sleep) ---
-        next_target_time = TOTAL_MUSIC_DURATION
-        # Se houver mais linhas, usa o tempo da próxima linha como alvo.
-        if current_line_index < len(LYRICS_DATA):
-            next_target_time = LYRICS_DATA[current_line_index]["time"]
-            
-        # Calcula o tempo exato para esperar (tempo alvo - tempo decorrido).
-        time_to_sleep = next_target_time - (time.monotonic() - start_time) 
-        # Garante um mínimo de 10ms de espera e evita valores negativos.
-        time_to_sleep = max(0.01, time_to_sleep) 
-        time.sleep(time_to_sleep) # Pausa a execução.
+
+            # Só desenha depois de chegar ao tempo da primeira linha (antes disso apenas espera).
+            if display_index_for_display >= 0:
+                # Proteção contra ultrapassar o limite final da lista.
+                if display_index_for_display >= len(LYRICS_DATA):
+                    display_index_for_display = len(LYRICS_DATA) - 1
+
+                # Entrega o índice para a thread de desenho (não espera o terminal).
+                publish_display_index(display_index_for_display)
+
+            # --- Cálculo do Tempo de Espera (Sleep) ---
+            next_target_time = TOTAL_MUSIC_DURATION
+            # Se houver mais linhas, usa o tempo da próxima linha como alvo.
+            if current_line_index < len(LYRICS_DATA):
+                next_target_time = lyric_times[current_line_index]
+
+            # Dorme até o instante absoluto (deadline) da próxima linha; se ele já passou, não espera.
+            deadline = start_time + next_target_time
+            time.sleep(max(0.0, deadline - time.perf_counter())) # Pausa a execução.
+    finally:
+        stop_render_thread(render_thread)   # Garante que nada mais seja desenhado depois daqui.
 
     # Mensagem Final
     with screen_lock:                       # Protege a saída para a mensagem final.
-        update_terminal_size()
-        sys.stdout.write(CLEAR_SCREEN)      # Limpa a tela para a mensagem final.
         final_message = "FIM DA MÚSICA 🎶 (Modelo Base)"
         
         color_code = BOLD + INFO_COLOR
         
-        # Lógica de centralização da mensagem.
-        final_message_col = (terminal_width - len(final_message) - len(color_code) - len(RESET)) // 2
+        # Lógica de centralização da mensagem: só o texto visível ocupa colunas (códigos ANSI não),
+        # e as colunas do terminal começam em 1.
+        final_message_col = (terminal_width - len(final_message)) // 2 + 1
         final_message_row = terminal_height // 2
         
-        # Escreve a mensagem final centralizada.
-        sys.stdout.write(f"{CURSOR_POS(final_message_row, final_message_col)}{color_code}{final_message}{RESET}\n")
-        
         artist_title = f"{CONTENT_INFO['artist_lines'][0]} - {CONTENT_INFO['title_lines'][0]}"
-        # Escreve o título/artista centralizado abaixo.
-        sys.stdout.write(f"{CURSOR_POS(final_message_row + 1, (terminal_width - len(artist_title) - len(INFO_COLOR) - len(RESET)) // 2)}{BOLD}{INFO_COLOR}{artist_title}{RESET}\n")
+        artist_title_col = (terminal_width - len(artist_title)) // 2 + 1
         
+        # Limpa a tela e escreve a mensagem final e o título/artista (abaixo) centralizados, em uma única escrita.
+        sys.stdout.write(
+            CLEAR_SCREEN
+            + f"{CURSOR_POS(final_message_row, final_message_col)}{color_code}{final_message}{RESET}\n"
+            + f"{CURSOR_POS(final_message_row + 1, artist_title_col)}{BOLD}{INFO_COLOR}{artist_title}{RESET}\n"
+        )
         sys.stdout.flush()
     time.sleep(3) # Espera 3 segundos antes de continuar.
 
@@ -307,12 +442,12 @@ if __name__ == "__main__":
 
         start_lyrics_animation() # Inicia a função principal de animação.
         with screen_lock:
-            sys.stdout.write(CLEAR_SCREEN)
             update_terminal_size()
             message = "Programa finalizado. Pressione Enter para sair."
-            # Exibe a mensagem de finalização antes de pedir o input.
-            sys.stdout.write(CURSOR_POS(terminal_height // 2 - 1, (terminal_width - len(message)) // 2))
-            sys.stdout.write(message + "\n")
+            # Limpa a tela e exibe a mensagem de finalização antes de pedir o input (uma única escrita).
+            sys.stdout.write(
+                CLEAR_SCREEN + CURSOR_POS(terminal_height // 2 - 1, (terminal_width - len(message)) // 2 + 1) + message + "\n"
+            )
             sys.stdout.flush()
         input() # Aguarda o usuário pressionar Enter para fechar (muito importante).
     except KeyboardInterrupt:
@@ -5,9 +5,16 @@ Carrega e converte dados de letras da API do Spotify (color-lyrics/v2/track/)
 para o formato esperado pela aplicação de animação de letras.
 """
 
+from __future__ import annotations
+
 import json
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import IO, List, Dict, Optional
+
+try:
+    import orjson  # Parser JSON opcional e mais rápido; usado automaticamente se estiver instalado
+except ImportError:
+    orjson = None
 
 
 class SpotifyLyricsLoader:
@@ -47,7 +54,7 @@ class SpotifyLyricsLoader:
         self._raw_data: Optional[List[Dict]] = None
         self._metadata: Optional[Dict] = None
 
-    def load(self) -> bool:
+    def load(self, *, fileobj: Optional[IO] = None) -> bool:
         """
         Carrega e analisa o arquivo JSON.
 
@@ -55,12 +62,18 @@ class SpotifyLyricsLoader:
         1. Array de letras (formato antigo)
         2. Objeto com "title", "artist" e "lyrics" (formato novo)
 
+        Usa o orjson para a análise quando disponível, senão o módulo json padrão.
+
+        Args:
+            fileobj (IO): Objeto de arquivo já aberto (texto ou binário) para ler no
+                lugar de json_file (opcional)
+
         Returns:
             bool: True se carregado com sucesso, False caso contrário
         """
         try:
-            with open(self.json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            raw = fileobj.read() if fileobj is not None else self.json_file.read_bytes()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
             # Verifica se é o novo formato (objeto com title, artist, lyrics)
             if isinstance(data, dict) and 'lyrics' in data:
@@ -83,7 +96,8 @@ class SpotifyLyricsLoader:
         except FileNotFoundError:
             print(f"Erro: Arquivo '{self.json_file}' não encontrado.")
             return False
-        except json.JSONDecodeError:
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            # orjson.JSONDecodeError é subclasse de json.JSONDecodeError
             print(f"Erro: JSON inválido em '{self.json_file}'.")
             return False
 
@@ -92,27 +106,14 @@ class SpotifyLyricsLoader:
         Converte dados brutos de letras do Spotify para o formato LYRICS_DATA.
         Filtra entradas vazias e converte milissegundos para segundos.
         """
-        self._lyrics_data = []
-
-        if not self._raw_data:
-            return
-
-        for item in self._raw_data:
-            # Pula entradas com palavras vazias
-            if not item.get('words', '').strip():
-                continue
-
-            # Converte startTimeMs de milissegundos (string) para segundos (float)
-            start_time_ms = int(item.get('startTimeMs', 0))
-            start_time_seconds = start_time_ms / 1000.0
-
-            # Cria a entrada convertida no formato LYRICS_DATA
-            converted_entry = {
-                "time": start_time_seconds,
-                "original": item.get('words', '')
-            }
-
-            self._lyrics_data.append(converted_entry)
+        # Uma única passada: "words" é lido uma vez por entrada, entradas vazias são
+        # descartadas e startTimeMs (milissegundos, string) vira segundos (float)
+        self._lyrics_data = [
+            {"time": int(item.get('startTimeMs', 0)) / 1000.0, "original": words}
+            for item in self._raw_data or []
+            for words in (item.get('words', ''),)
+            if words.strip()
+        ]
 
     def get_lyrics_data(self) -> List[Dict]:
         """
@@ -3,215 +3,244 @@ Pytest configuration and shared fixtures for SpotifyLyricsLoader tests.
 """
 
 import pytest
+import io
 import json
-import tempfile
-from pathlib import Path
 
+try:
+    import orjson  # Serializador JSON opcional e mais rápido; usado automaticamente se estiver instalado
+except ImportError:
+    orjson = None
+
+from src.loaders import SpotifyLyricsLoader
+
+
+# Dados de teste: os literais Python são a fonte de verdade; as versões
+# serializadas (_*_BLOB) são geradas uma única vez, na importação do módulo
+
+VALID_SPOTIFY_LYRICS_DATA = [
+    {
+        "startTimeMs": "7430",
+        "words": "Uh, acordei desligado",
+        "syllables": [],
+        "endTimeMs": "0",
+        "transliteratedWords": ""
+    },
+    {
+        "startTimeMs": "12010",
+        "words": "Sonhei que tava acordado",
+        "syllables": [],
+        "endTimeMs": "0",
+        "transliteratedWords": ""
+    },
+    {
+        "startTimeMs": "15240",
+        "words": "Só queria você aqui do meu lado",
+        "syllables": [],
+        "endTimeMs": "0",
+        "transliteratedWords": ""
+    },
+    {
+        "startTimeMs": "106750",
+        "words": "",  # Entrada vazia - deve ser filtrada
+        "syllables": [],
+        "endTimeMs": "0",
+        "transliteratedWords": ""
+    }
+]
+
+NEW_FORMAT_SPOTIFY_LYRICS_DATA = {
+    "title": "Desligado",
+    "artist": "Yago Oproprio, Jean Tassy, Zero",
+    "lyrics": VALID_SPOTIFY_LYRICS_DATA
+}
+
+WHITESPACE_ONLY_DATA = [
+    {
+        "startTimeMs": "100",
+        "words": "   ",  # Apenas espaço em branco
+        "syllables": [],
+        "endTimeMs": "0",
+        "transliteratedWords": ""
+    }
+]
+
+ZERO_MILLISECONDS_DATA = [
+    {
+        "startTimeMs": "0",
+        "words": "First word at start",
+        "syllables": [],
+        "endTimeMs": "0",
+        "transliteratedWords": ""
+    }
+]
+
+LARGE_MILLISECONDS_DATA = [
+    {
+        "startTimeMs": "3600000",  # 1 hora
+        "words": "Song at one hour",
+        "syllables": [],
+        "endTimeMs": "0",
+        "transliteratedWords": ""
+    }
+]
 
-@pytest.fixture
+MINIMAL_ENTRY_DATA = [
+    {
+        "startTimeMs": "1000",
+        "words": "Minimal entry"
+        # Faltam syllables, endTimeMs, transliteratedWords
+    }
+]
+
+SPECIAL_CHARACTERS_DATA = [
+    {
+        "startTimeMs": "1000",
+        "words": "Açúcar, café & pão!",
+        "syllables": [],
+        "endTimeMs": "0",
+        "transliteratedWords": ""
+    }
+]
+
+
+def _dumps(data):
+    """Serializa dados de teste para bytes JSON em UTF-8, com o orjson quando disponível."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+_VALID_BLOB = _dumps(VALID_SPOTIFY_LYRICS_DATA)
+_NEW_FORMAT_BLOB = _dumps(NEW_FORMAT_SPOTIFY_LYRICS_DATA)
+_EMPTY_BLOB = _dumps([])
+_WHITESPACE_ONLY_BLOB = _dumps(WHITESPACE_ONLY_DATA)
+_ZERO_MILLISECONDS_BLOB = _dumps(ZERO_MILLISECONDS_DATA)
+_LARGE_MILLISECONDS_BLOB = _dumps(LARGE_MILLISECONDS_DATA)
+_MINIMAL_ENTRY_BLOB = _dumps(MINIMAL_ENTRY_DATA)
+_SPECIAL_CHARACTERS_BLOB = _dumps(SPECIAL_CHARACTERS_DATA)
+_INVALID_UTF8_BLOB = b'[{"startTimeMs": "1000", "words": "\xff\xfe"}]'
+
+
+@pytest.fixture(scope="session")
 def valid_spotify_lyrics_data():
     """Fixture que fornece uma estrutura válida de dados de letras do Spotify."""
-    return [
-        {
-            "startTimeMs": "7430",
-            "words": "Uh, acordei desligado",
-            "syllables": [],
-            "endTimeMs": "0",
-            "transliteratedWords": ""
-        },
-        {
-            "startTimeMs": "12010",
-            "words": "Sonhei que tava acordado",
-            "syllables": [],
-            "endTimeMs": "0",
-            "transliteratedWords": ""
-        },
-        {
-            "startTimeMs": "15240",
-            "words": "Só queria você aqui do meu lado",
-            "syllables": [],
-            "endTimeMs": "0",
-            "transliteratedWords": ""
-        },
-        {
-            "startTimeMs": "106750",
-            "words": "",  # Entrada vazia - deve ser filtrada
-            "syllables": [],
-            "endTimeMs": "0",
-            "transliteratedWords": ""
-        }
-    ]
+    return VALID_SPOTIFY_LYRICS_DATA
 
 
-@pytest.fixture
-def temp_json_file(valid_spotify_lyrics_data):
-    """Fixture que cria um arquivo JSON temporário com dados válidos de letras."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        json.dump(valid_spotify_lyrics_data, f)
-        temp_path = f.name
-    yield temp_path
-    # Limpeza
-    Path(temp_path).unlink()
+@pytest.fixture(scope="session")
+def new_format_spotify_lyrics_data():
+    """Fixture que fornece dados no novo formato com título, artista e letras."""
+    return NEW_FORMAT_SPOTIFY_LYRICS_DATA
 
 
-@pytest.fixture
-def temp_invalid_json_file():
-    """Fixture que cria um arquivo temporário com JSON inválido."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        f.write("{invalid json content}")
-        temp_path = f.name
-    yield temp_path
-    Path(temp_path).unlink()
+@pytest.fixture(scope="session")
+def lyrics_dir(tmp_path_factory):
+    """Fixture que fornece o diretório único da sessão onde os arquivos de teste são gravados."""
+    return tmp_path_factory.mktemp("spotify_lyrics", numbered=False)
 
 
-@pytest.fixture
-def temp_empty_json_file():
-    """Fixture que cria um arquivo temporário com um array JSON vazio."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        json.dump([], f)
-        temp_path = f.name
-    yield temp_path
-    Path(temp_path).unlink()
+@pytest.fixture(scope="session")
+def make_json_file(lyrics_dir):
+    """
+    Fixture que fornece uma fábrica de arquivos JSON temporários.
 
+    A fábrica grava ``raw`` (bytes) como está, ou serializa ``data``, no
+    arquivo ``name`` dentro de lyrics_dir e retorna o caminho.
+    """
+    def _make_json_file(name, data=None, *, raw=None):
+        path = lyrics_dir / name
+        path.write_bytes(raw if raw is not None else _dumps(data))
+        return str(path)
 
-@pytest.fixture
-def temp_whitespace_only_json_file():
-    """Fixture que cria um arquivo temporário com letras apenas com espaços em branco."""
-    data = [
-        {
-            "startTimeMs": "100",
-            "words": "   ",  # Apenas espaço em branco
-            "syllables": [],
-            "endTimeMs": "0",
-            "transliteratedWords": ""
-        }
-    ]
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        json.dump(data, f)
-        temp_path = f.name
-    yield temp_path
-    Path(temp_path).unlink()
+    return _make_json_file
 
 
-@pytest.fixture
-def temp_zero_milliseconds_json_file():
-    """Fixture que cria um arquivo temporário com milissegundos zero."""
-    data = [
-        {
-            "startTimeMs": "0",
-            "words": "First word at start",
-            "syllables": [],
-            "endTimeMs": "0",
-            "transliteratedWords": ""
-        }
-    ]
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        json.dump(data, f)
-        temp_path = f.name
-    yield temp_path
-    Path(temp_path).unlink()
+@pytest.fixture(scope="session")
+def temp_json_file(make_json_file):
+    """Fixture que cria um arquivo JSON temporário com dados válidos de letras."""
+    return make_json_file("valid.json", raw=_VALID_BLOB)
 
 
-@pytest.fixture
-def temp_large_milliseconds_json_file():
-    """Fixture que cria um arquivo temporário com valores de milissegundos grandes (1 hora)."""
-    data = [
-        {
-            "startTimeMs": "3600000",  # 1 hora
-            "words": "Song at one hour",
-            "syllables": [],
-            "endTimeMs": "0",
-            "transliteratedWords": ""
-        }
-    ]
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        json.dump(data, f)
-        temp_path = f.name
-    yield temp_path
-    Path(temp_path).unlink()
+@pytest.fixture(scope="session")
+def temp_invalid_utf8_json_file(make_json_file):
+    """Fixture que cria um arquivo temporário com bytes que não são UTF-8 válido."""
+    return make_json_file("invalid_utf8.json", raw=_INVALID_UTF8_BLOB)
 
 
-@pytest.fixture
-def temp_minimal_entry_json_file():
-    """Fixture que cria um arquivo temporário com entrada mínima (campos opcionais ausentes)."""
-    data = [
-        {
-            "startTimeMs": "1000",
-            "words": "Minimal entry"
-            # Faltam syllables, endTimeMs, transliteratedWords
-        }
-    ]
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        json.dump(data, f)
-        temp_path = f.name
-    yield temp_path
-    Path(temp_path).unlink()
+@pytest.fixture(scope="session")
+def temp_whitespace_only_json_file(make_json_file):
+    """Fixture que cria um arquivo temporário com letras apenas com espaços em branco."""
+    return make_json_file("whitespace_only.json", raw=_WHITESPACE_ONLY_BLOB)
 
 
-@pytest.fixture
-def temp_special_characters_json_file():
+_EDGE_CASE_FILES = {
+    "zero": ("zero_milliseconds.json", _ZERO_MILLISECONDS_BLOB),
+    "large": ("large_milliseconds.json", _LARGE_MILLISECONDS_BLOB),
+    "minimal": ("minimal_entry.json", _MINIMAL_ENTRY_BLOB),
+}
+
+
+@pytest.fixture(scope="session", params=list(_EDGE_CASE_FILES))
+def edge_case_json_file(request, make_json_file):
+    """
+    Fixture parametrizada que cria o arquivo de um caso extremo de entrada única:
+    "zero" (milissegundos zero), "large" (1 hora) ou "minimal" (campos opcionais ausentes).
+    """
+    name, blob = _EDGE_CASE_FILES[request.param]
+    return make_json_file(name, raw=blob)
+
+
+@pytest.fixture(scope="session")
+def temp_special_characters_json_file(make_json_file):
     """Fixture que cria um arquivo temporário com caracteres especiais em letras."""
-    data = [
-        {
-            "startTimeMs": "1000",
-            "words": "Açúcar, café & pão!",
-            "syllables": [],
-            "endTimeMs": "0",
-            "transliteratedWords": ""
-        }
-    ]
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False, encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False)
-        temp_path = f.name
-    yield temp_path
-    Path(temp_path).unlink()
+    return make_json_file("special_characters.json", raw=_SPECIAL_CHARACTERS_BLOB)
 
 
-@pytest.fixture
-def new_format_spotify_lyrics_data():
-    """Fixture que fornece dados no novo formato com título, artista e letras."""
-    return {
-        "title": "Desligado",
-        "artist": "Yago Oproprio, Jean Tassy, Zero",
-        "lyrics": [
-            {
-                "startTimeMs": "7430",
-                "words": "Uh, acordei desligado",
-                "syllables": [],
-                "endTimeMs": "0",
-                "transliteratedWords": ""
-            },
-            {
-                "startTimeMs": "12010",
-                "words": "Sonhei que tava acordado",
-                "syllables": [],
-                "endTimeMs": "0",
-                "transliteratedWords": ""
-            },
-            {
-                "startTimeMs": "15240",
-                "words": "Só queria você aqui do meu lado",
-                "syllables": [],
-                "endTimeMs": "0",
-                "transliteratedWords": ""
-            },
-            {
-                "startTimeMs": "106750",
-                "words": "",  # Entrada vazia - deve ser filtrada
-                "syllables": [],
-                "endTimeMs": "0",
-                "transliteratedWords": ""
-            }
-        ]
-    }
+@pytest.fixture(scope="session")
+def temp_new_format_json_file(make_json_file):
+    """Fixture que cria um arquivo JSON temporário no novo formato."""
+    return make_json_file("new_format.json", raw=_NEW_FORMAT_BLOB)
+
+
+@pytest.fixture(scope="session")
+def json_fileobj_valid():
+    """Fixture que fornece uma fábrica de streams em memória com dados válidos de letras."""
+    return lambda: io.BytesIO(_VALID_BLOB)
+
+
+@pytest.fixture(scope="session")
+def json_fileobj_new_format():
+    """Fixture que fornece uma fábrica de streams em memória com dados no novo formato."""
+    return lambda: io.BytesIO(_NEW_FORMAT_BLOB)
+
+
+@pytest.fixture(scope="session")
+def json_fileobj_empty():
+    """Fixture que fornece uma fábrica de streams em memória com um array JSON vazio."""
+    return lambda: io.BytesIO(_EMPTY_BLOB)
+
+
+@pytest.fixture(scope="session")
+def loaded_loader(json_fileobj_valid):
+    """Fixture que fornece um loader já carregado com os dados válidos (somente leitura)."""
+    loader = SpotifyLyricsLoader("valid.json")
+    loader.load(fileobj=json_fileobj_valid())
+    return loader
+
+
+@pytest.fixture(scope="session")
+def loaded_new_format_loader(json_fileobj_new_format):
+    """Fixture que fornece um loader já carregado com os dados no novo formato (somente leitura)."""
+    loader = SpotifyLyricsLoader("new_format.json")
+    loader.load(fileobj=json_fileobj_new_format())
+    return loader
 
 
 @pytest.fixture
-def temp_new_format_json_file(new_format_spotify_lyrics_data):
-    """Fixture que cria um arquivo JSON temporário no novo formato."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False, encoding='utf-8') as f:
-        json.dump(new_format_spotify_lyrics_data, f, ensure_ascii=False)
-        temp_path = f.name
-    yield temp_path
-    # Limpeza
-    Path(temp_path).unlink()
+def make_loader(json_fileobj_valid):
+    """Fixture que fornece uma fábrica de loaders carregados com os dados válidos e metadados opcionais."""
+    def _make_loader(**kwargs):
+        loader = SpotifyLyricsLoader("valid.json", **kwargs)
+        loader.load(fileobj=json_fileobj_valid())
+        return loader
+    return _make_loader